@@ -7,7 +7,7 @@ import numpy as np
 from docarray import BaseDoc, DocList
 from docarray.documents import AudioDoc
 from docarray.typing import AudioUrl
-from pydantic import Field, conint, conlist
+from pydantic import BaseModel, Field, conint, conlist
 
 
 class TextDoc(BaseDoc):
@@ -18,7 +18,7 @@ class Base64ByteStrDoc(BaseDoc):
     byte_str: str
 
 
-class DocPath(BaseDoc):
+class DocPath(BaseModel):
     path: str
     chunk_size: int = 1500
     chunk_overlap: int = 100
@@ -76,7 +76,7 @@ class RerankedDoc(BaseDoc):
     initial_query: str
 
 
-class LLMParamsDoc(BaseDoc):
+class LLMParamsDoc(BaseModel):
     query: str
     max_new_tokens: int = 1024
     top_k: int = 10
@@ -87,7 +87,7 @@ class LLMParamsDoc(BaseDoc):
     streaming: bool = True
 
 
-class LLMParams(BaseDoc):
+class LLMParams(BaseModel):
     max_new_tokens: int = 1024
     top_k: int = 10
     top_p: float = 0.95
@@ -124,7 +124,7 @@ class GraphDoc(BaseDoc):
     rag_embedding_node_property: Optional[str] = Field(default="embedding")
 
 
-class LVMDoc(BaseDoc):
+class LVMDoc(BaseModel):
     image: str
     prompt: str
     max_new_tokens: conint(ge=0, le=1024) = 512
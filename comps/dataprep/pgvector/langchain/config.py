@@ -16,5 +16,8 @@ INDEX_NAME = os.getenv("INDEX_NAME", "rag-pgvector")
 CHUNK_SIZE = os.getenv("CHUNK_SIZE", 1500)
 CHUNK_OVERLAP = os.getenv("CHUNK_OVERLAP", 100)
 
+# max number of uploaded files ingested concurrently
+INGEST_CONCURRENCY = int(os.getenv("INGEST_CONCURRENCY", 4))
+
 current_file_path = os.path.abspath(__file__)
 parent_dir = os.path.dirname(current_file_path)
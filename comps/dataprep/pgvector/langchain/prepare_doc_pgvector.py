@@ -1,13 +1,15 @@
 # Copyright (C) 2024 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
-import json
+import asyncio
+import functools
 import os
 import uuid
 from pathlib import Path
 from typing import List, Optional, Union
 
-from config import CHUNK_OVERLAP, CHUNK_SIZE, EMBED_MODEL, INDEX_NAME, PG_CONNECTION_STRING
+import orjson
+from config import CHUNK_OVERLAP, CHUNK_SIZE, EMBED_MODEL, INDEX_NAME, INGEST_CONCURRENCY, PG_CONNECTION_STRING
 from fastapi import File, Form, HTTPException, UploadFile
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.embeddings import HuggingFaceBgeEmbeddings, HuggingFaceHubEmbeddings
@@ -31,25 +33,24 @@ async def save_file_to_local_disk(save_path: str, file):
             raise HTTPException(status_code=500, detail=f"Write file {save_path} failed. Exception: {e}")
 
 
+@functools.lru_cache(maxsize=8)
+def get_text_splitter(chunk_size: int, chunk_overlap: int):
+    return RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap, add_start_index=True)
+
+
 def ingest_doc_to_pgvector(doc_path: DocPath):
     """Ingest document to PGVector."""
+    text_splitter = get_text_splitter(doc_path.chunk_size, doc_path.chunk_overlap)
     doc_path = doc_path.path
     print(f"Parsing document {doc_path}.")
 
-    text_splitter = RecursiveCharacterTextSplitter(chunk_size=1500, chunk_overlap=100, add_start_index=True)
     content = document_loader(doc_path)
     chunks = text_splitter.split_text(content)
+    # repeated boilerplate (headers, footers) would be embedded and stored once per copy
+    chunks = list(dict.fromkeys(chunks))
     print("Done preprocessing. Created ", len(chunks), " chunks of the original pdf")
     print("PG Connection", PG_CONNECTION_STRING)
 
-    # Create vectorstore
-    if tei_embedding_endpoint:
-        # create embeddings using TEI endpoint service
-        embedder = HuggingFaceHubEmbeddings(model=tei_embedding_endpoint)
-    else:
-        # create embeddings using local embedding model
-        embedder = HuggingFaceBgeEmbeddings(model_name=EMBED_MODEL)
-
     # Batch size
     batch_size = 32
     num_chunks = len(chunks)
@@ -57,9 +58,7 @@ def ingest_doc_to_pgvector(doc_path: DocPath):
         batch_chunks = chunks[i : i + batch_size]
         batch_texts = batch_chunks
 
-        _ = PGVector.from_texts(
-            texts=batch_texts, embedding=embedder, collection_name=INDEX_NAME, connection_string=PG_CONNECTION_STRING
-        )
+        _ = vector_db.add_texts(texts=batch_texts)
         print(f"Processed batch {i//batch_size + 1}/{(num_chunks-1)//batch_size + 1}")
     return True
 
@@ -75,21 +74,7 @@ def ingest_link_to_pgvector(link_list: List[str]):
         texts.append(data)
         metadatas.append(metadata)
 
-    # Create vectorstore
-    if tei_embedding_endpoint:
-        # create embeddings using TEI endpoint service
-        embedder = HuggingFaceHubEmbeddings(model=tei_embedding_endpoint)
-    else:
-        # create embeddings using local embedding model
-        embedder = HuggingFaceBgeEmbeddings(model_name=EMBED_MODEL)
-
-    _ = PGVector.from_texts(
-        texts=texts,
-        embedding=embedder,
-        metadatas=metadatas,
-        collection_name=INDEX_NAME,
-        connection_string=PG_CONNECTION_STRING,
-    )
+    _ = vector_db.add_texts(texts=texts, metadatas=metadatas)
 
 
 @register_microservice(
@@ -115,26 +100,59 @@ async def ingest_documents(
         upload_folder = "./uploaded_files/"
         if not os.path.exists(upload_folder):
             Path(upload_folder).mkdir(parents=True, exist_ok=True)
-        for file in files:
-            save_path = upload_folder + file.filename
-            await save_file_to_local_disk(save_path, file)
-            ingest_doc_to_pgvector(DocPath(path=save_path))
+        # files are independent, ingest them concurrently off the event loop
+        semaphore = asyncio.Semaphore(INGEST_CONCURRENCY)
+
+        async def ingest_file(save_path):
+            try:
+                async with semaphore:
+                    await asyncio.to_thread(ingest_doc_to_pgvector, DocPath(path=save_path))
+            finally:
+                # the saved copy is only read during ingestion, don't let unique names pile up on disk
+                Path(save_path).unlink(missing_ok=True)
             print(f"Successfully saved file {save_path}")
+
+        # start ingesting each file as soon as it is saved, while the next one is written
+        ingest_tasks = []
+        try:
+            for file in files:
+                # uploads sharing a filename must not overwrite each other while being ingested
+                save_path = upload_folder + f"{uuid.uuid4()}_{file.filename}"
+                await save_file_to_local_disk(save_path, file)
+                ingest_tasks.append(asyncio.create_task(ingest_file(save_path)))
+        finally:
+            # wait for every started ingest before responding, even if a later save failed
+            results = await asyncio.gather(*ingest_tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
         return {"status": 200, "message": "Data preparation succeeded"}
 
     if link_list:
         try:
-            link_list = json.loads(link_list)  # Parse JSON string to list
+            link_list = orjson.loads(link_list)  # Parse JSON string to list
             if not isinstance(link_list, list):
                 raise HTTPException(status_code=400, detail="link_list should be a list.")
             ingest_link_to_pgvector(link_list)
             print(f"Successfully saved link list {link_list}")
             return {"status": 200, "message": "Data preparation succeeded"}
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             raise HTTPException(status_code=400, detail="Invalid JSON format for link_list.")
 
     raise HTTPException(status_code=400, detail="Must provide either a file or a string list.")
 
 
 if __name__ == "__main__":
+    # Create vectorstore once, shared by every ingest request
+    if tei_embedding_endpoint:
+        # create embeddings using TEI endpoint service
+        embedder = HuggingFaceHubEmbeddings(model=tei_embedding_endpoint)
+    else:
+        # create embeddings using local embedding model
+        embedder = HuggingFaceBgeEmbeddings(model_name=EMBED_MODEL)
+    vector_db = PGVector(
+        embedding_function=embedder,
+        collection_name=INDEX_NAME,
+        connection_string=PG_CONNECTION_STRING,
+    )
     opea_microservices["opea_service@prepare_doc_pgvector"].start()
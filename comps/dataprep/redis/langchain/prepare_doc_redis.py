@@ -1,8 +1,10 @@
 # Copyright (C) 2024 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 import json
 import os
+import threading
 import uuid
 from pathlib import Path
 from typing import List, Optional, Union
@@ -21,6 +23,9 @@ from comps.dataprep.utils import document_loader, get_tables_result, parse_html
 
 tei_embedding_endpoint = os.getenv("TEI_ENDPOINT")
 
+# pyspark allows only one active SparkContext per process
+spark_lock = threading.Lock()
+
 
 async def save_file_to_local_disk(save_path: str, file):
     save_path = Path(save_path)
@@ -135,20 +140,6 @@ async def ingest_documents(
         if not os.path.exists(upload_folder):
             Path(upload_folder).mkdir(parents=True, exist_ok=True)
         uploaded_files = []
-        for file in files:
-            save_path = upload_folder + file.filename
-            await save_file_to_local_disk(save_path, file)
-            ingest_data_to_redis(
-                DocPath(
-                    path=save_path,
-                    chunk_size=chunk_size,
-                    chunk_overlap=chunk_overlap,
-                    process_table=process_table,
-                    table_strategy=table_strategy,
-                )
-            )
-            uploaded_files.append(save_path)
-            print(f"Successfully saved file {save_path}")
 
         def process_files_wrapper(files):
             if not isinstance(files, list):
@@ -156,21 +147,51 @@ async def ingest_documents(
             for file in files:
                 ingest_data_to_redis(DocPath(path=file, chunk_size=chunk_size, chunk_overlap=chunk_overlap))
 
+        def process_files_parallel():
+            with spark_lock:
+                sc = None
+                try:
+                    # Create a SparkContext
+                    conf = SparkConf().setAppName("Parallel-dataprep").setMaster("local[*]")
+                    sc = SparkContext(conf=conf)
+                    # Create an RDD with parallel processing
+                    parallel_num = min(len(uploaded_files), os.cpu_count())
+                    rdd = sc.parallelize(uploaded_files, parallel_num)
+                    # Perform a parallel operation
+                    rdd_trans = rdd.map(process_files_wrapper)
+                    rdd_trans.collect()
+                    # Stop the SparkContext
+                    sc.stop()
+                except:
+                    # Stop the SparkContext
+                    if sc is not None:
+                        sc.stop()
+
         try:
-            # Create a SparkContext
-            conf = SparkConf().setAppName("Parallel-dataprep").setMaster("local[*]")
-            sc = SparkContext(conf=conf)
-            # Create an RDD with parallel processing
-            parallel_num = min(len(uploaded_files), os.cpu_count())
-            rdd = sc.parallelize(uploaded_files, parallel_num)
-            # Perform a parallel operation
-            rdd_trans = rdd.map(process_files_wrapper)
-            rdd_trans.collect()
-            # Stop the SparkContext
-            sc.stop()
-        except:
-            # Stop the SparkContext
-            sc.stop()
+            for file in files:
+                # uploads sharing a filename must not overwrite each other while being parsed
+                save_path = upload_folder + f"{uuid.uuid4()}_{file.filename}"
+                uploaded_files.append(save_path)
+                await save_file_to_local_disk(save_path, file)
+                # parsing and pdf table extraction are blocking, keep them off the event loop
+                await asyncio.to_thread(
+                    ingest_data_to_redis,
+                    DocPath(
+                        path=save_path,
+                        chunk_size=chunk_size,
+                        chunk_overlap=chunk_overlap,
+                        process_table=process_table,
+                        table_strategy=table_strategy,
+                    ),
+                )
+                print(f"Successfully saved file {save_path}")
+
+            # the spark job re-ingests every file and blocks until done, run it off the event loop too
+            await asyncio.to_thread(process_files_parallel)
+        finally:
+            # saved copies are only read during ingestion, don't let unique names pile up on disk
+            for save_path in uploaded_files:
+                Path(save_path).unlink(missing_ok=True)
         return {"status": 200, "message": "Data preparation succeeded"}
 
     if link_list:
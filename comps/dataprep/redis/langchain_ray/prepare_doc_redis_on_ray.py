@@ -231,7 +231,7 @@ def ingest_data_to_redis(file_list: List[DocPath], enable_ray=False, num_cpus=20
         ds = ds.map(data_to_redis_ray, num_cpus=num_cpus)
         return ray_execute(ds, log_name)
     else:
-        for file in tqdm(file_list, total=len(file_list)):
+        for file in tqdm(file_list, total=len(file_list), disable=None):
             with Timer(f"read document {file}."):
                 data = document_loader(file)
             with Timer(f"ingest document {file} to Redis."):
@@ -252,7 +252,7 @@ def ingest_link_to_redis(link_list: List[str], enable_ray=False, num_cpus=20):
         ds = ds.map(data_to_redis_ray, num_cpus=num_cpus)
         return ray_execute(ds, log_name)
     else:
-        for link in tqdm(link_list, total=len(link_list)):
+        for link in tqdm(link_list, total=len(link_list), disable=None):
             with Timer(f"read document {link}."):
                 data = _parse_html(link)
             if debug:
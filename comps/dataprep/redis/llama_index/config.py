@@ -4,6 +4,7 @@
 import os
 
 EMBED_MODEL = os.getenv("EMBED_MODEL", "BAAI/bge-base-en-v1.5")
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", 32))
 
 # Redis Connection Information
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
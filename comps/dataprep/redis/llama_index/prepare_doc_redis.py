@@ -6,7 +6,7 @@ import os
 from pathlib import Path
 from typing import List, Optional, Union
 
-from config import EMBED_MODEL, INDEX_NAME, REDIS_URL
+from config import EMBED_BATCH_SIZE, EMBED_MODEL, INDEX_NAME, REDIS_URL
 from fastapi import File, Form, HTTPException, UploadFile
 from langsmith import traceable
 from llama_index.core import SimpleDirectoryReader, StorageContext, VectorStoreIndex
@@ -31,7 +31,7 @@ async def save_file_to_local_disk(save_path: str, file):
 
 
 async def ingest_data_to_redis(doc_path: DocPath):
-    embedder = HuggingFaceEmbedding(model_name=EMBED_MODEL)
+    embedder = HuggingFaceEmbedding(model_name=EMBED_MODEL, embed_batch_size=EMBED_BATCH_SIZE)
     print(f"embedder: {embedder}")
     Settings.embed_model = embedder
     doc_path = doc_path.path
@@ -1,6 +1,7 @@
 # Copyright (C) 2024 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
 import os
 from typing import List
 
@@ -30,18 +31,22 @@ class PIIDetectorWithLLM(PIIDetector):
         return True
 
 
+@functools.lru_cache(maxsize=4)
+def load_ner_pipeline(model_key):
+    # only successful loads are cached, a failed load raises and is retried next time
+    from transformers import AutoTokenizer, pipeline
+
+    tokenizer = AutoTokenizer.from_pretrained(model_key, model_max_length=512)
+    return pipeline(model=model_key, task="token-classification", tokenizer=tokenizer, grouped_entities=True)
+
+
 class PIIDetectorWithNER(PIIDetector):
     def __init__(self, model_path=None):
         super().__init__()
-        from transformers import AutoTokenizer, pipeline
-
         _model_key = "bigcode/starpii"
         _model_key = _model_key if model_path is None else os.path.join(model_path, _model_key)
         try:
-            tokenizer = AutoTokenizer.from_pretrained(_model_key, model_max_length=512)
-            self.pipeline = pipeline(
-                model=_model_key, task="token-classification", tokenizer=tokenizer, grouped_entities=True
-            )
+            self.pipeline = load_ner_pipeline(_model_key)
         except Exception as e:
             print("Failed to load model, skip NER classification", e)
             self.pipeline = None
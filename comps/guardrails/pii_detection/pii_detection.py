@@ -64,7 +64,7 @@ def file_based_pii_detect(file_list: List[DocPath], strategy, enable_ray=False,
 
     else:
         ret = []
-        for file in tqdm(file_list, total=len(file_list)):
+        for file in tqdm(file_list, total=len(file_list), disable=None):
             with Timer(f"read document {file}."):
                 data = document_loader(file)
             with Timer(f"detect pii on document {file} to Redis."):
@@ -90,7 +90,7 @@ def link_based_pii_detect(link_list: List[str], strategy, enable_ray=False, debu
         ret = ray_execute(ds, log_name)
     else:
         ret = []
-        for link in tqdm(link_list, total=len(link_list)):
+        for link in tqdm(link_list, total=len(link_list), disable=None):
             with Timer(f"read document {link}."):
                 data = _parse_html(link)
             if debug:
@@ -114,7 +114,7 @@ def text_based_pii_detect(text_list: List[str], strategy, enable_ray=False, debu
         ret = ray_execute(ds, log_name)
     else:
         ret = []
-        for data in tqdm(text_list, total=len(text_list)):
+        for data in tqdm(text_list, total=len(text_list), disable=None):
             if debug:
                 print("content is: ", data)
             with Timer(f"detect pii on document {data[:50]} to Redis."):
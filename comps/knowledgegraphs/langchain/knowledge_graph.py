@@ -8,7 +8,9 @@ import sys
 cur_path = pathlib.Path(__file__).parent.resolve()
 comps_path = os.path.join(cur_path, "../../../")
 sys.path.append(comps_path)
+import functools
 import json
+import time
 
 import requests
 from langchain import hub
@@ -27,8 +29,20 @@ from langsmith import traceable
 from comps import GeneratedDoc, GraphDoc, ServiceType, opea_microservices, register_microservice
 
 
+@functools.lru_cache(maxsize=4)
+def get_graph(neo4j_endpoint, neo4j_username, neo4j_password):
+    # keep one Neo4jGraph, and so one driver connection pool, per endpoint
+    return Neo4jGraph(url=neo4j_endpoint, username=neo4j_username, password=neo4j_password)
+
+
+@functools.lru_cache(maxsize=4)
+def get_embeddings(model_name):
+    # loading the sentence-transformers model is expensive, share it across requests
+    return HuggingFaceEmbeddings(model_name=model_name)
+
+
 def get_retriever(input, neo4j_endpoint, neo4j_username, neo4j_password, llm):
-    embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-mpnet-base-v2")
+    embeddings = get_embeddings("sentence-transformers/all-mpnet-base-v2")
     vector_index = Neo4jVector.from_existing_graph(
         embeddings,
         url=neo4j_endpoint,
@@ -43,12 +57,41 @@ def get_retriever(input, neo4j_endpoint, neo4j_username, neo4j_password, llm):
     return vector_qa
 
 
+# apoc.meta.schema samples the whole database, so only re-read it when stale
+schema_ttl = int(os.getenv("NEO4J_SCHEMA_TTL", 60))
+schema_refreshed_at = {}
+
+
+def refresh_schema(graph):
+    now = time.monotonic()
+    last = schema_refreshed_at.get(id(graph))
+    if last is None or now - last > schema_ttl:
+        graph.refresh_schema()
+        schema_refreshed_at[id(graph)] = now
+
+
 def get_cypherchain(graph, cypher_llm, qa_llm):
-    graph.refresh_schema()
+    refresh_schema(graph)
     cypher_chain = GraphCypherQAChain.from_llm(cypher_llm=cypher_llm, qa_llm=qa_llm, graph=graph, verbose=True)
     return cypher_chain
 
 
+@functools.lru_cache(maxsize=8)
+def get_react_prompt(tools_description, tool_names):
+    # the tool set is fixed, so pull the hub prompt and fill in the tools once
+    prompt = hub.pull("hwchase17/react-json")
+    return prompt.partial(tools=tools_description, tool_names=tool_names)
+
+
+@functools.lru_cache(maxsize=8)
+def get_chat_model(llm_repo_id):
+    # building ChatHuggingFace resolves the model id and loads its tokenizer,
+    # so keep one bound chat model per repo id across requests
+    llm = HuggingFaceEndpoint(repo_id=llm_repo_id, max_new_tokens=512)
+    chat_model = ChatHuggingFace(llm=llm)
+    return chat_model.bind(stop=["\nObservation"])
+
+
 def get_agent(vector_qa, cypher_chain, llm_repo_id):
     # define two tools
     tools = [
@@ -72,16 +115,10 @@ def get_agent(vector_qa, cypher_chain, llm_repo_id):
     ]
 
     # setup ReAct style prompt
-    prompt = hub.pull("hwchase17/react-json")
-    prompt = prompt.partial(
-        tools=render_text_description(tools),
-        tool_names=", ".join([t.name for t in tools]),
-    )
+    prompt = get_react_prompt(render_text_description(tools), ", ".join([t.name for t in tools]))
 
     # define chat model
-    llm = HuggingFaceEndpoint(repo_id=llm_repo_id, max_new_tokens=512)
-    chat_model = ChatHuggingFace(llm=llm)
-    chat_model_with_stop = chat_model.bind(stop=["\nObservation"])
+    chat_model_with_stop = get_chat_model(llm_repo_id)
 
     # define agent
     agent = (
@@ -112,7 +149,7 @@ def graph_query(input: GraphDoc) -> GeneratedDoc:
     neo4j_endpoint = os.getenv("NEO4J_ENDPOINT", "neo4j://localhost:7687")
     neo4j_username = os.getenv("NEO4J_USERNAME", "neo4j")
     neo4j_password = os.getenv("NEO4J_PASSWORD", "neo4j")
-    graph = Neo4jGraph(url=neo4j_endpoint, username=neo4j_username, password=neo4j_password)
+    graph = get_graph(neo4j_endpoint, neo4j_username, neo4j_password)
 
     ## keep for multiple tests, will remove later
     graph.query("MATCH (n) DETACH DELETE n")
@@ -145,6 +182,8 @@ def graph_query(input: GraphDoc) -> GeneratedDoc:
     ## process input query
     if input.strtype == "cypher":
         result_dicts = graph.query(input.text)
+        # raw cypher may have changed the schema
+        schema_refreshed_at.pop(id(graph), None)
         result = ""
         for result_dict in result_dicts:
             for key in result_dict:
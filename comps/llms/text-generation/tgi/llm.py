@@ -29,40 +29,40 @@ from comps import (
 @traceable(run_type="llm")
 @register_statistics(names=["opea_service@llm_tgi"])
 def llm_generate(input: LLMParamsDoc):
-    start = time.time()
-    llm_endpoint = os.getenv("TGI_LLM_ENDPOINT", "http://localhost:8080")
-    llm = HuggingFaceEndpoint(
-        endpoint_url=llm_endpoint,
-        max_new_tokens=input.max_new_tokens,
-        top_k=input.top_k,
-        top_p=input.top_p,
-        typical_p=input.typical_p,
-        temperature=input.temperature,
-        repetition_penalty=input.repetition_penalty,
-        streaming=input.streaming,
-        timeout=600,
-    )
+    start = time.monotonic()
+    # sampling parameters are passed per call so the endpoint is built (and logged in) only once
+    gen_kwargs = {
+        "max_new_tokens": input.max_new_tokens,
+        "top_k": input.top_k,
+        "top_p": input.top_p,
+        "typical_p": input.typical_p,
+        "temperature": input.temperature,
+        "repetition_penalty": input.repetition_penalty,
+    }
     if input.streaming:
-        stream_gen_time = []
 
         async def stream_generator():
             chat_response = ""
-            async for text in llm.astream(input.query):
-                stream_gen_time.append(time.time() - start)
+            first_token_latency = None
+            async for text in llm.astream(input.query, **gen_kwargs):
+                if first_token_latency is None:
+                    first_token_latency = time.monotonic() - start
                 chat_response += text
                 chunk_repr = repr(text.encode("utf-8"))
-                print(f"[llm - chat_stream] chunk:{chunk_repr}")
                 yield f"data: {chunk_repr}\n\n"
+            latency = time.monotonic() - start
             print(f"[llm - chat_stream] stream response: {chat_response}")
-            statistics_dict["opea_service@llm_tgi"].append_latency(stream_gen_time[-1], stream_gen_time[0])
+            statistics_dict["opea_service@llm_tgi"].append_latency(latency, first_token_latency)
             yield "data: [DONE]\n\n"
 
         return StreamingResponse(stream_generator(), media_type="text/event-stream")
     else:
-        response = llm.invoke(input.query)
-        statistics_dict["opea_service@llm_tgi"].append_latency(time.time() - start, None)
+        response = llm.invoke(input.query, **gen_kwargs)
+        statistics_dict["opea_service@llm_tgi"].append_latency(time.monotonic() - start, None)
         return GeneratedDoc(text=response, prompt=input.query)
 
 
 if __name__ == "__main__":
+    llm_endpoint = os.getenv("TGI_LLM_ENDPOINT", "http://localhost:8080")
+    llm = HuggingFaceEndpoint(endpoint_url=llm_endpoint, timeout=600)
     opea_microservices["opea_service@llm_tgi"].start()
@@ -7,10 +7,9 @@ from fastapi.responses import StreamingResponse
 from langchain_community.llms import VLLMOpenAI
 from langsmith import traceable
 
-from comps import GeneratedDoc, LLMParamsDoc, ServiceType, opea_microservices, opea_telemetry, register_microservice
+from comps import GeneratedDoc, LLMParamsDoc, ServiceType, opea_microservices, register_microservice
 
 
-@opea_telemetry
 def post_process_text(text: str):
     if text == " ":
         return "data: @#$\n\n"
@@ -43,9 +43,7 @@ def reranking(input: SearchedDoc) -> LLMParamsDoc:
         response = requests.post(url, data=json.dumps(data), headers=headers)
         response_data = response.json()
         best_response_list = heapq.nlargest(input.top_n, response_data, key=lambda x: x["score"])
-        context_str = ""
-        for best_response in best_response_list:
-            context_str = context_str + " " + input.retrieved_docs[best_response["index"]].text
+        context_str = "".join(" " + docs[best_response["index"]] for best_response in best_response_list)
         if context_str and len(re.findall("[\u4E00-\u9FFF]", context_str)) / len(context_str) >= 0.3:
             # chinese context
             template = "仅基于以下背景回答问题:\n{context}\n问题: {question}"
@@ -9,6 +9,11 @@ EMBED_MODEL = os.getenv("EMBED_MODEL", "BAAI/bge-base-en-v1.5")
 
 PG_CONNECTION_STRING = os.getenv("PG_CONNECTION_STRING", "localhost")
 
+# Connection pool, sized for concurrent retrieval requests
+PG_POOL_SIZE = int(os.getenv("PG_POOL_SIZE", 20))
+PG_MAX_OVERFLOW = int(os.getenv("PG_MAX_OVERFLOW", 10))
+PG_POOL_RECYCLE = int(os.getenv("PG_POOL_RECYCLE", 3600))
+
 # Vector Index Configuration
 INDEX_NAME = os.getenv("INDEX_NAME", "rag-pgvector")
 
@@ -4,7 +4,7 @@
 import os
 import time
 
-from config import EMBED_MODEL, INDEX_NAME, PG_CONNECTION_STRING, PORT
+from config import EMBED_MODEL, INDEX_NAME, PG_CONNECTION_STRING, PG_MAX_OVERFLOW, PG_POOL_RECYCLE, PG_POOL_SIZE, PORT
 from langchain_community.embeddings import HuggingFaceBgeEmbeddings, HuggingFaceHubEmbeddings
 from langchain_community.vectorstores import PGVector
 from langsmith import traceable
@@ -56,5 +56,6 @@ if __name__ == "__main__":
         embedding_function=embeddings,
         collection_name=INDEX_NAME,
         connection_string=PG_CONNECTION_STRING,
+        engine_args={"pool_size": PG_POOL_SIZE, "max_overflow": PG_MAX_OVERFLOW, "pool_recycle": PG_POOL_RECYCLE},
     )
     opea_microservices["opea_service@retriever_pgvector"].start()